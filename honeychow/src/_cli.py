@@ -3,6 +3,14 @@ import argparse
 from . import __author__, __version__
 
 
+def positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1"""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description='"Honey Chow": A fast, asynchronous username enumeration tool.',
@@ -29,7 +37,7 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "-w",
         "--workers",
-        type=int,
+        type=positive_int,
         default=100,
         help="Max concurrent requests (default: 100)",
     )
@@ -82,6 +90,16 @@ def parse_args() -> argparse.Namespace:
         metavar="PATH",
         help="Load sites database from local JSON file instead of remote",
     )
+    parser.add_argument(
+        "--refresh-sites-cache",
+        action="store_true",
+        help="Re-download the remote sites database, ignoring the local cache",
+    )
+    parser.add_argument(
+        "--no-update-check",
+        action="store_true",
+        help="Don't check PyPI for a newer version of honeychow",
+    )
     parser.add_argument(
         "-v",
         "--version",
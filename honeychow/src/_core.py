@@ -1,28 +1,38 @@
 import asyncio
+import codecs
 import csv
+import heapq
 import json
+import os
+import random
+import time
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
-from typing import Optional
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional, TYPE_CHECKING
 from urllib.parse import urlparse
 
-import aiohttp
-from rich.bar import Bar
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-    BarColumn,
-    TaskProgressColumn,
-    TimeRemainingColumn,
-)
-from rich.status import Status
-from rich.table import Table
-from update_checker import UpdateChecker
+from platformdirs import user_cache_dir
+
+try:
+    # orjson's parser is considerably faster on the multi-hundred-KB database;
+    # its JSONDecodeError subclasses json.JSONDecodeError
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from . import console, __version__
 
+# aiohttp, rich's renderables and update_checker are imported where they're
+# used so that --help and --version don't pay for them at startup.
+if TYPE_CHECKING:
+    import aiohttp
+    from rich.status import Status
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SiteResult:
     site_name: str
     category: str
@@ -33,16 +43,63 @@ class SiteResult:
     error: Optional[str] = None
 
 
+@dataclass(slots=True)
+class CompiledSite:
+    """A sites' database entry, normalised once when the database is loaded"""
+
+    name: str
+    category: str
+    # Lowercased once for the --sites/--categories filters
+    name_lower: str
+    category_lower: str
+    url_tmpl: str
+    # None when the display URL is the same as the check URL
+    pretty_tmpl: Optional[str]
+    strip_chars: str
+    strip_table: dict[int, None]
+    # Site-specific headers only; DEFAULT_HEADERS are sent by the session
+    headers: Mapping[str, str]
+    post_body_tmpl: Optional[str]
+    # hit/miss strings encoded as UTF-8
+    hit_bytes: bytes
+    miss_bytes: bytes
+    # hit/miss strings encoded for other response charsets, filled on demand
+    encoded_markers: dict[str, tuple[bytes, bytes]]
+    # (status_code, hit_found) -> (exists, confidence), see _compile_check
+    check: Callable[[int, bool], tuple[bool, int]]
+
+
 class HoneyChow:
     # Database sources in order of priority
     DATABASE_SOURCES = [
         # "https://codeberg.org/rly0nheart/honeychow/raw/branch/master/data/honeychow-sites.json",
         "https://raw.githubusercontent.com/libreosint/honeychow/refs/heads/master/data/honeychow-sites.json",
     ]
+    # Sent with every request; set on the ClientSession so aiohttp merges
+    # them with site-specific headers itself
+    DEFAULT_HEADERS = MappingProxyType(
+        {
+            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:147.0) Gecko/20100101 Firefox/147.0",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        }
+    )
+    # Minimum number of seconds between PyPI update checks
+    UPDATE_CHECK_INTERVAL = 24 * 60 * 60
+    # Stop reading a response body after this many bytes when matching strings
+    MAX_BODY_BYTES = 2 * 1024 * 1024
+    # Minimum number of seconds between progress bar updates during a search
+    PROGRESS_UPDATE_INTERVAL = 0.1
+    # Attempts per site when a connection drops or the site rate-limits us,
+    # the base of the exponential backoff between them, and the longest
+    # we'll wait before a retry (longer Retry-After values aren't honoured)
+    MAX_ATTEMPTS = 3
+    RETRY_BACKOFF = 0.25
+    MAX_RETRY_DELAY = 5.0
 
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        session: "aiohttp.ClientSession",
         max_concurrent: int = 50,
         quiet: bool = False,
     ):
@@ -50,49 +107,168 @@ class HoneyChow:
         self.max_concurrent = max_concurrent
         self.quiet = quiet
         self.sites: list[dict] = []
-        self.default_headers = {
-            "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:147.0) Gecko/20100101 Firefox/147.0",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.5",
-        }
+        self._compiled: list[CompiledSite] = []
+
+    def _update_check_path(self) -> Path:
+        """Path of the file recording when updates were last checked for"""
+        return self._cache_path().with_name("update.json")
+
+    def update_check_due(self) -> bool:
+        """Whether the last update check is older than UPDATE_CHECK_INTERVAL"""
+        try:
+            data = json.loads(self._update_check_path().read_text(encoding="utf-8"))
+            last_check = float(data.get("last_check", 0))
+        except (OSError, ValueError, TypeError, AttributeError):
+            return True
+
+        return time.time() - last_check >= self.UPDATE_CHECK_INTERVAL
+
+    async def check_updates(self):
+        """
+        Check PyPI for a newer release.
+        The blocking request runs in a worker thread so it can overlap
+        with loading the sites database.
+        """
+        from update_checker import UpdateChecker
 
-    @staticmethod
-    def check_updates(status: Optional[Status] = None):
         checker = UpdateChecker()
-        status.update("[dim]Checking for updates…[/dim]")
-        result = checker.check(package_name="honeychow", package_version=__version__)
+        result = await asyncio.to_thread(
+            checker.check, package_name="honeychow", package_version=__version__
+        )
+
+        try:
+            path = self._update_check_path()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps({"last_check": time.time()}), encoding="utf-8")
+        except OSError:
+            pass
 
         if result:
             console.print(result)
 
-    async def database_from_remote(self, status: Optional[Status] = None) -> bool:
+    @staticmethod
+    def _cache_path() -> Path:
+        """Path of the locally cached copy of the remote sites database"""
+        return Path(user_cache_dir("honeychow")) / "sites.json"
+
+    def _cache_meta_path(self) -> Path:
+        """Path of the cached database's validators (ETag/Last-Modified)"""
+        return self._cache_path().with_name("sites.meta.json")
+
+    def _load_cache_meta(self, source_url: str) -> dict:
+        """Load the cached validators for a source, if any"""
+        try:
+            meta = json.loads(self._cache_meta_path().read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        if meta.get("source") != source_url or not self._cache_path().exists():
+            return {}
+        return meta
+
+    def _load_cached(self) -> bool:
+        """
+        Load sites from the cached database.
+        Returns True if successful, False otherwise.
+        """
+        try:
+            data = json_loads(self._cache_path().read_bytes())
+        except (OSError, json.JSONDecodeError):
+            # Drop the broken cache so the next run does a full fetch
+            self._cache_meta_path().unlink(missing_ok=True)
+            return False
+
+        self._load_sites(data)
+        return True
+
+    def _store_cache(
+        self, source_url: str, body: bytes, headers: Mapping[str, str]
+    ) -> None:
+        """Atomically persist a fetched database along with its validators"""
+        cache_path = self._cache_path()
+        meta_path = self._cache_meta_path()
+        meta = {
+            "source": source_url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+        }
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            for path, content in (
+                (cache_path, body),
+                (meta_path, json.dumps(meta).encode("utf-8")),
+            ):
+                tmp = path.with_name(f"{path.name}.tmp")
+                tmp.write_bytes(content)
+                os.replace(tmp, path)
+        except OSError:
+            # Caching is best-effort; a read-only cache dir shouldn't break a search
+            pass
+
+    async def database_from_remote(
+        self, status: Optional["Status"] = None, refresh: bool = False
+    ) -> bool:
         """
         Fetch sites database from remote sources.
         Tries multiple sources in order until one succeeds.
+        A locally cached copy is revalidated with a conditional GET
+        and reused if unchanged, unless refresh is True.
         Returns True if successful, False otherwise.
         """
+        import aiohttp
+
         for source_url in self.DATABASE_SOURCES:
             domain = urlparse(source_url).netloc
-            if isinstance(status, Status):
+            if status is not None:
                 status.update(f"[dim]Fetching sites' database from {domain}…[/dim]")
+
+            request_headers = {}
+            if not refresh:
+                meta = self._load_cache_meta(source_url)
+                if etag := meta.get("etag"):
+                    request_headers["If-None-Match"] = etag
+                if last_modified := meta.get("last_modified"):
+                    request_headers["If-Modified-Since"] = last_modified
+
             try:
-                async with self.session.get(source_url) as response:
-                    if response.status == 200:
-                        data = await response.json(content_type=None)
-                        self.sites = data.get("sites", [])
-                        if not self.quiet:
-                            if isinstance(status, Status):
-                                status.stop()
-                            console.print(
-                                f"Loaded {len(self.sites)} sites from {domain}"
-                            )
-                        return True
+                while True:
+                    async with self.session.get(
+                        source_url, headers=request_headers
+                    ) as response:
+                        if response.status == 304 and request_headers:
+                            if self._load_cached():
+                                if not self.quiet:
+                                    if status is not None:
+                                        status.stop()
+                                    console.print(
+                                        f"Loaded {len(self.sites)} sites from {domain} (cached)"
+                                    )
+                                return True
+
+                            # The cached copy is unreadable, so fetch it in full
+                            request_headers = {}
+                            continue
+
+                        if response.status == 200:
+                            body = await response.read()
+                            self._load_sites(json_loads(body))
+                            self._store_cache(source_url, body, response.headers)
+                            if not self.quiet:
+                                if status is not None:
+                                    status.stop()
+                                console.print(
+                                    f"Loaded {len(self.sites)} sites from {domain}"
+                                )
+                            return True
+                    break
             except (
                 aiohttp.ClientError,
                 asyncio.TimeoutError,
                 json.JSONDecodeError,
             ) as e:
-                if isinstance(status, Status):
+                if status is not None:
                     status.stop()
                 console.log(
                     f"[[bold red]✘[/bold red]] Failed to fetch database: {response.status} {e}"
@@ -105,48 +281,85 @@ class HoneyChow:
         return False
 
     def database_from_file(
-        self, filepath: str, status: Optional[Status] = None
+        self, filepath: str, status: Optional["Status"] = None
     ) -> bool:
         """
         Load sites database from a local JSON file.
         Returns True if successful, False otherwise.
         """
-        if isinstance(status, Status):
+        if status is not None:
             status.update(f"[dim]Loading sites' database from: {filepath}…[/dim]")
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.sites = data.get("sites", [])
+            with open(filepath, "rb") as f:
+                self._load_sites(json_loads(f.read()))
                 if not self.quiet:
-                    if isinstance(status, Status):
+                    if status is not None:
                         status.stop()
                     console.print(
                         f"Loaded {len(self.sites)} sites from [file://{filepath}]{filepath}"
                     )
                 return True
         except FileNotFoundError:
-            if isinstance(status, Status):
+            if status is not None:
                 status.stop()
             console.print(
                 f"[[bold red]✘[/bold red]] Database file not found: {filepath}"
             )
             return False
         except json.JSONDecodeError as e:
-            if isinstance(status, Status):
+            if status is not None:
                 status.stop()
             console.print(
                 f"[[bold red]✘[/bold red]] Invalid JSON in database file: {e}"
             )
             return False
         except Exception as e:
-            if isinstance(status, Status):
+            if status is not None:
                 status.stop()
             console.print(f"[[bold red]✘[/bold red]] Failed to load database: {e}")
             return False
 
+    def _load_sites(self, data: dict):
+        """Set the loaded database's sites and compile them for searching"""
+        self.sites = data.get("sites", [])
+        self._compiled = [self._compile(site) for site in self.sites]
+
+    @staticmethod
+    def _compile(site: dict) -> CompiledSite:
+        """Normalise a database entry so checks don't repeat lookups per search"""
+        uri_check = site.get("uri_check", "")
+        uri_pretty = site.get("uri_pretty")
+        strip_chars = site.get("strip_bad_char") or ""
+        hit_string = site.get("hit_string") or ""
+        miss_string = site.get("miss_string") or ""
+
+        name = site.get("name", "Unknown")
+        category = site.get("category", "unknown")
+
+        return CompiledSite(
+            name=name,
+            category=category,
+            name_lower=name.lower(),
+            category_lower=category.lower(),
+            url_tmpl=uri_check,
+            pretty_tmpl=uri_pretty if uri_pretty and uri_pretty != uri_check else None,
+            strip_chars=strip_chars,
+            strip_table=str.maketrans("", "", strip_chars),
+            headers=MappingProxyType(site.get("headers") or site.get("header") or {}),
+            post_body_tmpl=site.get("post_body") or None,
+            hit_bytes=hit_string.encode(),
+            miss_bytes=miss_string.encode(),
+            encoded_markers={},
+            check=HoneyChow._compile_check(
+                site.get("hit_code"), site.get("miss_code"), hit_string
+            ),
+        )
+
     def list_sites(self):
         """List all available sites"""
+        from rich.table import Table
+
         table = Table(
             show_header=False,
             show_edge=False,
@@ -164,6 +377,8 @@ class HoneyChow:
 
     def list_categories(self):
         """List all available categories"""
+        from rich.table import Table
+
         categories: dict[str, int] = {}
         for site in self.sites:
             category = site.get("category", "unknown")
@@ -184,140 +399,290 @@ class HoneyChow:
         console.print(table)
 
     @staticmethod
-    def _prepare_url(site: dict, username: str) -> str:
-        """Prepare the check URL with username substitution"""
-        url = site.get("uri_check", "")
+    def _markers(site: CompiledSite, charset: Optional[str]) -> tuple[bytes, bytes]:
+        """
+        The site's (hit, miss) strings encoded in the response's charset,
+        falling back to UTF-8 when none (or an unknown one) is given.
+        A string the charset can't represent can never match, so it becomes
+        an empty marker.
+        """
+        encoding = "utf-8"
+        if charset:
+            try:
+                encoding = codecs.lookup(charset).name
+            except LookupError:
+                pass
+
+        if encoding == "utf-8":
+            return site.hit_bytes, site.miss_bytes
+
+        markers = site.encoded_markers.get(encoding)
+        if markers is None:
+            encoded = []
+            for marker in (site.hit_bytes, site.miss_bytes):
+                try:
+                    encoded.append(marker.decode().encode(encoding))
+                except UnicodeEncodeError:
+                    encoded.append(b"")
+            markers = site.encoded_markers[encoding] = (encoded[0], encoded[1])
+        return markers
+
+    async def _match_body(
+        self, resp: "aiohttp.ClientResponse", hit: bytes, miss: bytes
+    ) -> tuple[bool, bool]:
+        """
+        Stream the response body looking for the hit/miss markers.
+        Returns (hit_found, miss_found), stopping as soon as the result is
+        decided: once miss is seen (it takes precedence), or once hit is seen
+        when there's no miss to look for. Never reads more than MAX_BODY_BYTES.
+        hit and miss must already be encoded in the response's charset
+        (see _markers), so matching is done on the raw bytes.
+        """
+        hit_found = False
+        if not hit and not miss:
+            return hit_found, False
+
+        # Keep just enough of the previous chunk to catch a marker that
+        # straddles a chunk boundary
+        overlap = max(len(hit), len(miss)) - 1
+        tail = b""
+        read = 0
+
+        async for chunk in resp.content.iter_chunked(8192):
+            window = tail + chunk
+            if miss and miss in window:
+                return hit_found, True
+            if hit and not hit_found and hit in window:
+                hit_found = True
+                if not miss:
+                    break
+
+            read += len(chunk)
+            if read >= self.MAX_BODY_BYTES:
+                break
+            tail = window[-overlap:] if overlap else b""
+
+        return hit_found, False
+
+    @staticmethod
+    def _compile_check(
+        hit_code: Optional[int], miss_code: Optional[int], hit_string: str
+    ) -> Callable[[int, bool], tuple[bool, int]]:
+        """
+        Pick the existence check for a site's combination of hit_code,
+        miss_code and hit_string, so the per-response check doesn't
+        re-branch on them. The returned function takes (status_code,
+        hit_found) and returns (exists, confidence). A found miss_string
+        is handled by the caller, since it decides the result on its own.
+        """
+        if hit_code and hit_string:
 
-        clean_username = username
-        if strip_chars := site.get("strip_bad_char"):
-            for char in strip_chars:
-                clean_username = clean_username.replace(char, "")
+            def check(status_code: int, hit_found: bool) -> tuple[bool, int]:
+                if hit_found:
+                    return True, 100 if status_code == hit_code else 60
+                return False, 80
 
-        return url.replace("{account}", clean_username)
+        elif hit_code and miss_code:
 
-    @staticmethod
-    def _prepare_pretty_url(site: dict, username: str) -> str:
-        """Get the display URL"""
-        url = site.get("uri_pretty") or site.get("uri_check", "")
+            def check(status_code: int, hit_found: bool) -> tuple[bool, int]:
+                if status_code == miss_code:
+                    return False, 90
+                if status_code == hit_code:
+                    return True, 70
+                return False, 80
 
-        clean_username = username
-        if strip_chars := site.get("strip_bad_char"):
-            for char in strip_chars:
-                clean_username = clean_username.replace(char, "")
+        elif hit_code:
 
-        return url.replace("{account}", clean_username)
+            def check(status_code: int, hit_found: bool) -> tuple[bool, int]:
+                if status_code == hit_code:
+                    return True, 70
+                return False, 80
 
-    def _prepare_headers(self, site: dict) -> dict:
-        """Merge default headers with site-specific headers"""
-        headers = self.default_headers.copy()
-        site_headers = site.get("headers") or site.get("header") or {}
-        headers.update(site_headers)
-        return headers
+        elif miss_code and not hit_string:
 
-    @staticmethod
-    def _prepare_post_body(site: dict, username: str) -> Optional[str]:
-        """Prepare POST body if needed"""
-        if post_body := site.get("post_body"):
-            clean_username = username
-            if strip_chars := site.get("strip_bad_char"):
-                for char in strip_chars:
-                    clean_username = clean_username.replace(char, "")
-            return post_body.replace("{account}", clean_username)
-        return None
+            def check(status_code: int, hit_found: bool) -> tuple[bool, int]:
+                if status_code == miss_code:
+                    return False, 90
+                return False, 50
+
+        else:
+
+            def check(status_code: int, hit_found: bool) -> tuple[bool, int]:
+                return False, 50
+
+        return check
+
+    async def _fetch(
+        self,
+        session: "aiohttp.ClientSession",
+        site: CompiledSite,
+        url: str,
+        post_body: Optional[str],
+    ) -> tuple[int, bool, bool, Optional[str]]:
+        """
+        Request a site's check URL.
+        Returns (status_code, hit_found, miss_found, retry_after).
+        """
+        headers = site.headers
+
+        if post_body:
+            async with session.post(
+                url, headers=headers, data=post_body, read_bufsize=65536
+            ) as resp:
+                hit_found, miss_found = await self._match_body(
+                    resp, *self._markers(site, resp.charset)
+                )
+                return (
+                    resp.status,
+                    hit_found,
+                    miss_found,
+                    resp.headers.get("Retry-After"),
+                )
+
+        # Without hit/miss strings only the status code matters,
+        # so a HEAD request avoids downloading the body
+        if not (site.hit_bytes or site.miss_bytes):
+            async with session.head(url, headers=headers, allow_redirects=True) as resp:
+                # Some servers don't implement HEAD; retry those with GET
+                if resp.status not in (405, 501):
+                    return resp.status, False, False, resp.headers.get("Retry-After")
+
+        async with session.get(
+            url, headers=headers, allow_redirects=True, read_bufsize=65536
+        ) as resp:
+            hit_found, miss_found = await self._match_body(
+                resp, *self._markers(site, resp.charset)
+            )
+            return resp.status, hit_found, miss_found, resp.headers.get("Retry-After")
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with jitter before retrying a request"""
+        delay = self.RETRY_BACKOFF * 2**attempt + random.random() * 0.1
+        return min(delay, self.MAX_RETRY_DELAY)
 
     @staticmethod
-    def _check_exists(site: dict, status_code: int, text: str) -> tuple[bool, int]:
-        """Check if account exists based on response."""
-        hit_code = site.get("hit_code")
-        hit_string = site.get("hit_string", "")
-        miss_string = site.get("miss_string", "")
-        miss_code = site.get("miss_code")
-
-        # Check for explicit "miss" indicators first
-        if miss_string and miss_string in text:
-            return False, 100
-
-        if miss_code and status_code == miss_code and not hit_string:
-            return False, 90
-
-        # Check for "exists" indicators
-        if hit_code and status_code == hit_code:
-            if hit_string:
-                if hit_string in text:
-                    return True, 100
-                else:
-                    return False, 80
-            else:
-                return True, 70
+    def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+        """Seconds to wait according to a Retry-After header, if it's valid"""
+        if not value:
+            return None
 
-        if hit_code and status_code != hit_code:
-            if hit_string and hit_string in text:
-                return True, 60
-            return False, 80
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
 
-        return False, 50
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
 
     async def _check_site(
         self,
-        session: aiohttp.ClientSession,
-        site: dict,
-        username: str,
-        semaphore: asyncio.Semaphore,
+        session: "aiohttp.ClientSession",
+        site: CompiledSite,
+        clean_usernames: dict[str, str],
     ) -> tuple[str, SiteResult]:
-        """Check a single site for username. Returns (site_name, result)"""
-        site_name = site.get("name", "Unknown")
-        category = site.get("category", "unknown")
+        """
+        Check a single site for username. Returns (site_name, result)
+        clean_usernames maps each site's strip_chars to the stripped username.
+        Dropped connections and 429/503 responses are retried with backoff.
+        """
+        import aiohttp
+
+        site_name = site.name
+        category = site.category
+
+        clean_username = clean_usernames[site.strip_chars]
+        url = site.url_tmpl.replace("{account}", clean_username)
+        pretty_url = (
+            site.pretty_tmpl.replace("{account}", clean_username)
+            if site.pretty_tmpl
+            else url
+        )
 
-        async with semaphore:
+        try:
+            post_body = (
+                site.post_body_tmpl.replace("{account}", clean_username)
+                if site.post_body_tmpl
+                else None
+            )
+
+            for attempt in range(self.MAX_ATTEMPTS):
+                retries_left = attempt < self.MAX_ATTEMPTS - 1
+                try:
+                    status, hit_found, miss_found, retry_after = await self._fetch(
+                        session, site, url, post_body
+                    )
+                except aiohttp.ClientConnectionError as e:
+                    # Timeouts already waited the full --timeout, so they
+                    # aren't worth repeating; dropped connections are
+                    if isinstance(e, asyncio.TimeoutError) or not retries_left:
+                        raise
+                    await asyncio.sleep(self._backoff(attempt))
+                    continue
+
+                if status in (429, 503) and retries_left:
+                    delay = self._parse_retry_after(retry_after)
+                    if delay is None:
+                        delay = self._backoff(attempt)
+                    if delay <= self.MAX_RETRY_DELAY:
+                        await asyncio.sleep(delay)
+                        continue
+                break
+
+            # An explicit "miss" indicator outweighs everything else
+            if miss_found:
+                exists, confidence = False, 100
+            else:
+                exists, confidence = site.check(status, hit_found)
+
+            return site_name, SiteResult(
+                site_name=site_name,
+                category=category,
+                url=pretty_url,
+                exists=exists,
+                status_code=status,
+                confidence=confidence,
+            )
+
+        except asyncio.TimeoutError:
+            return site_name, SiteResult(
+                site_name=site_name,
+                category=category,
+                url=pretty_url,
+                exists=False,
+                status_code=0,
+                confidence=0,
+                error="Timeout",
+            )
+        except Exception as e:
+            return site_name, SiteResult(
+                site_name=site_name,
+                category=category,
+                url=pretty_url,
+                exists=False,
+                status_code=0,
+                confidence=0,
+                error=str(e)[:50],
+            )
+
+    async def _worker(
+        self,
+        sites: asyncio.Queue,
+        clean_usernames: dict[str, str],
+        results: asyncio.Queue,
+    ):
+        """Check queued sites one at a time until the queue is drained"""
+        while True:
             try:
-                url = self._prepare_url(site, username)
-                headers = self._prepare_headers(site)
-                post_body = self._prepare_post_body(site, username)
-
-                if post_body:
-                    async with session.post(
-                        url, headers=headers, data=post_body
-                    ) as resp:
-                        status = resp.status
-                        text = await resp.text()
-                else:
-                    async with session.get(
-                        url, headers=headers, allow_redirects=True
-                    ) as resp:
-                        status = resp.status
-                        text = await resp.text()
-
-                exists, confidence = self._check_exists(site, status, text)
-
-                return site_name, SiteResult(
-                    site_name=site_name,
-                    category=category,
-                    url=self._prepare_pretty_url(site, username),
-                    exists=exists,
-                    status_code=status,
-                    confidence=confidence,
-                )
+                site = sites.get_nowait()
+            except asyncio.QueueEmpty:
+                return
 
-            except asyncio.TimeoutError:
-                return site_name, SiteResult(
-                    site_name=site_name,
-                    category=category,
-                    url=self._prepare_pretty_url(site, username),
-                    exists=False,
-                    status_code=0,
-                    confidence=0,
-                    error="Timeout",
-                )
-            except Exception as e:
-                return site_name, SiteResult(
-                    site_name=site_name,
-                    category=category,
-                    url=self._prepare_pretty_url(site, username),
-                    exists=False,
-                    status_code=0,
-                    confidence=0,
-                    error=str(e)[:50],
-                )
+            results.put_nowait(
+                await self._check_site(self.session, site, clean_usernames)
+            )
 
     async def search(
         self,
@@ -331,15 +696,22 @@ class HoneyChow:
         Search for username across sites.
         Returns (found, not_found, failed) tuples.
         """
-        sites_to_check = self.sites
+        from rich.progress import (
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            BarColumn,
+            TaskProgressColumn,
+            TimeRemainingColumn,
+        )
+
+        sites_to_check = self._compiled
 
         # Filter by specific site names
         if sites:
-            sites_lower = [site.lower() for site in sites]
+            wanted = frozenset(site.lower() for site in sites)
             sites_to_check = [
-                site
-                for site in self.sites
-                if site.get("name", "").lower() in sites_lower
+                site for site in self._compiled if site.name_lower in wanted
             ]
             if not sites_to_check:
                 console.print(
@@ -349,11 +721,9 @@ class HoneyChow:
 
         # Filter by categories
         if categories:
-            categories_lower = [category.lower() for category in categories]
+            wanted = frozenset(category.lower() for category in categories)
             sites_to_check = [
-                site
-                for site in sites_to_check
-                if site.get("category", "").lower() in categories_lower
+                site for site in sites_to_check if site.category_lower in wanted
             ]
 
         if not self.quiet:
@@ -361,14 +731,29 @@ class HoneyChow:
                 f"Searching for '@{username}' across {len(sites_to_check)} sites:\n"
             )
 
-        semaphore = asyncio.Semaphore(self.max_concurrent)
-        found: list[SiteResult] = []
+        # Found results are kept in a heap ordered by confidence (highest first,
+        # ties in arrival order), so no sort is needed once the search ends
+        found_heap: list[tuple[int, int, SiteResult]] = []
         not_found: list[SiteResult] = []
         failed: list[SiteResult] = []
 
-        tasks = [
-            self._check_site(self.session, site, username, semaphore)
-            for site in sites_to_check
+        # Strip the username once per distinct strip_bad_char set rather
+        # than once per site
+        clean_usernames: dict[str, str] = {}
+        for site in sites_to_check:
+            if site.strip_chars not in clean_usernames:
+                clean_usernames[site.strip_chars] = username.translate(site.strip_table)
+
+        # A fixed pool of workers drains the site queue, so at most
+        # max_concurrent checks (and tasks) exist at any one time
+        pending: asyncio.Queue = asyncio.Queue()
+        for site in sites_to_check:
+            pending.put_nowait(site)
+
+        results: asyncio.Queue = asyncio.Queue()
+        workers = [
+            asyncio.create_task(self._worker(pending, clean_usernames, results))
+            for _ in range(max(1, min(self.max_concurrent, len(sites_to_check))))
         ]
 
         with Progress(
@@ -386,44 +771,65 @@ class HoneyChow:
             console=console,
             disable=self.quiet,
             transient=True,
+            refresh_per_second=10,
         ) as progress:
             task = progress.add_task(
                 "Checking",
-                total=len(tasks),
+                total=len(sites_to_check),
                 current_site="Initialising...",
                 found=0,
                 not_found=0,
                 failed=0,
             )
 
-            for coroutine in asyncio.as_completed(tasks):
-                site_name, result = await coroutine
+            # Push counters to the progress bar at most every
+            # PROGRESS_UPDATE_INTERVAL seconds instead of once per site
+            advance = 0
+            last_update = time.monotonic()
+            remaining = len(sites_to_check)
 
-                progress.update(task, advance=1, current_site=site_name)
+            while remaining:
+                site_name, result = await results.get()
+                remaining -= 1
+                advance += 1
 
                 if result.error:
                     failed.append(result)
-                    progress.update(task, failed=len(failed))
                     if show_failed and not self.quiet:
                         progress.console.print(
                             f"[bold red]✘[/bold red] {result.site_name}: {result.error}"
                         )
                 elif result.exists:
-                    found.append(result)
-                    progress.update(task, found=len(found))
+                    heapq.heappush(
+                        found_heap, (-result.confidence, len(found_heap), result)
+                    )
                     if not self.quiet:
                         progress.console.print(
                             f"[bold green]✔[/bold green] {result.site_name}: {result.url}"
                         )
                 else:
                     not_found.append(result)
-                    progress.update(task, not_found=len(not_found))
                     if show_not_found and not self.quiet:
                         progress.console.print(
                             f"[bold yellow]✘[/bold yellow] {result.site_name}: {result.status_code}"
                         )
 
-        found.sort(key=lambda x: x.confidence, reverse=True)
+                now = time.monotonic()
+                if now - last_update >= self.PROGRESS_UPDATE_INTERVAL or not remaining:
+                    progress.update(
+                        task,
+                        advance=advance,
+                        current_site=site_name,
+                        found=len(found_heap),
+                        not_found=len(not_found),
+                        failed=len(failed),
+                    )
+                    advance = 0
+                    last_update = now
+
+        await asyncio.gather(*workers)
+
+        found = [heapq.heappop(found_heap)[2] for _ in range(len(found_heap))]
         return found, not_found, failed
 
     def print_tables(
@@ -438,6 +844,8 @@ class HoneyChow:
         if self.quiet:
             return
 
+        from rich.table import Table
+
         if not found:
             console.print("\n[[bold yellow]✘[/bold yellow]] No accounts found.")
         else:
@@ -515,6 +923,9 @@ class HoneyChow:
         failed: list[SiteResult],
     ):
         """Print search summary"""
+        from rich.bar import Bar
+        from rich.table import Table
+
         total = len(found) + len(not_found) + len(failed)
 
         # Group found by category
@@ -574,58 +985,55 @@ class HoneyChow:
         include_all: bool = False,
     ):
         """Export results to CSV"""
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
-            writer.writerow(
-                [
-                    "site_name",
-                    "category",
-                    "url",
-                    "status",
-                    "status_code",
-                    "confidence",
-                    "error",
-                ]
-            )
 
+        def rows():
             for result in found:
-                writer.writerow(
-                    [
+                yield (
+                    result.site_name,
+                    result.category,
+                    result.url,
+                    "found",
+                    result.status_code,
+                    result.confidence,
+                    "",
+                )
+
+            if include_all:
+                for result in not_found:
+                    yield (
                         result.site_name,
                         result.category,
                         result.url,
-                        "found",
+                        "not_found",
                         result.status_code,
                         result.confidence,
                         "",
-                    ]
-                )
-
-            if include_all:
-                for result in not_found:
-                    writer.writerow(
-                        [
-                            result.site_name,
-                            result.category,
-                            result.url,
-                            "not_found",
-                            result.status_code,
-                            result.confidence,
-                            "",
-                        ]
                     )
 
                 for result in failed:
-                    writer.writerow(
-                        [
-                            result.site_name,
-                            result.category,
-                            result.url,
-                            "failed",
-                            result.status_code,
-                            result.confidence,
-                            result.error,
-                        ]
+                    yield (
+                        result.site_name,
+                        result.category,
+                        result.url,
+                        "failed",
+                        result.status_code,
+                        result.confidence,
+                        result.error,
                     )
 
+        with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "site_name",
+                    "category",
+                    "url",
+                    "status",
+                    "status_code",
+                    "confidence",
+                    "error",
+                ]
+            )
+            writer.writerows(rows())
+
         console.print(f"[[bold green]+[/bold green]] Results exported to {filepath}")
@@ -1,8 +1,5 @@
 import asyncio
 
-import aiohttp
-from rich.status import Status
-
 from ._cli import parse_args
 from ._core import console, HoneyChow
 
@@ -10,21 +7,48 @@ from ._core import console, HoneyChow
 async def main():
     args = parse_args()
 
+    import aiohttp
+    from rich.status import Status
+
     try:
         timeout = aiohttp.ClientTimeout(total=args.timeout)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
+        # Size the pool to the worker count, cap per-host connections so a
+        # single origin isn't hammered, and cache DNS lookups across checks
+        connector = aiohttp.TCPConnector(
+            limit=args.workers,
+            limit_per_host=8,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            keepalive_timeout=30,
+        )
+        async with aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=HoneyChow.DEFAULT_HEADERS,
+            trust_env=True,
+        ) as session:
             honeychow = HoneyChow(
                 session=session, max_concurrent=args.workers, quiet=args.quiet
             )
 
             with Status(status="[dim]Initialising…[/dim]") as status:
-                honeychow.check_updates(status=status)
+                # Check for updates (at most once a day) alongside loading the database
+                update_task = None
+                if not args.no_update_check and honeychow.update_check_due():
+                    update_task = asyncio.create_task(honeychow.check_updates())
 
                 # Load sites from local file or fetch from remote
                 if args.database:
-                    if not honeychow.database_from_file(args.database, status=status):
-                        return
-                elif not await honeychow.database_from_remote(status=status):
+                    loaded = honeychow.database_from_file(args.database, status=status)
+                else:
+                    loaded = await honeychow.database_from_remote(
+                        status=status, refresh=args.refresh_sites_cache
+                    )
+
+                if update_task is not None:
+                    await update_task
+
+                if not loaded:
                     return
 
             # Handle --list-sites